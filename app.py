@@ -1,6 +1,44 @@
 import streamlit as st
 import numpy as np
-import scipy.stats as stats
+import pandas as pd
+import hashlib
+import inspect
+import warnings
+from functools import lru_cache
+from math import log, sqrt, exp, erfc, pi
+from numba import njit, guvectorize
+
+_SQRT_2 = sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
+# Smallest normal double; fastmath flushes anything below it to zero
+_MIN_NORMAL = 2.2250738585072014e-308
+# Range the solver keeps volatility within
+_MIN_VOLATILITY = 0.001
+_MAX_VOLATILITY = 5.0
+
+@njit(cache=True, fastmath=True)
+def _norm_cdf(x):
+    """
+    Standard normal cumulative distribution function
+
+    Written with erfc so the lower tail keeps full relative precision instead
+    of rounding to zero, which the log-price iteration depends on. Kept on
+    the library function rather than a rational approximation such as
+    Abramowitz & Stegun 26.2.17: its 7.5e-8 error stalls Halley short of the
+    1e-10 price tolerance, and the extra iterations cancel out the cheaper
+    evaluation
+    """
+    return 0.5 * erfc(-x / _SQRT_2)
+
+@njit(cache=True, fastmath=True)
+def _norm_pdf(x):
+    """Standard normal probability density function"""
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
+
+# Plain-Python bodies of the helpers above for the functions that run in the
+# interpreter; a call through the Numba dispatcher costs several times the math
+_py_norm_cdf = _norm_cdf.py_func
+_py_norm_pdf = _norm_pdf.py_func
 
 def calculate_option_vega(spot_price, strike_price, volatility, time_to_expiry, risk_free_rate):
     """
@@ -8,13 +46,37 @@ def calculate_option_vega(spot_price, strike_price, volatility, time_to_expiry,
     
     Vega measures how much the option price changes for a 1% change in implied volatility
     """
-    d2_numerator = np.log(spot_price / strike_price) + (risk_free_rate - 0.5 * volatility**2) * time_to_expiry
-    d2_denominator = volatility * np.sqrt(time_to_expiry)
+    d2_numerator = log(spot_price / strike_price) + (risk_free_rate - 0.5 * volatility**2) * time_to_expiry
+    d2_denominator = volatility * sqrt(time_to_expiry)
     d2 = d2_numerator / d2_denominator
     
-    vega = strike_price * np.exp(-risk_free_rate * time_to_expiry) * stats.norm.pdf(d2) * np.sqrt(time_to_expiry)
+    vega = strike_price * exp(-risk_free_rate * time_to_expiry) * _py_norm_pdf(d2) * sqrt(time_to_expiry)
     return vega
 
+def _resolve_option_style(option_style):
+    """Map 'call'/'c' to True and 'put'/'p' to False, rejecting anything else"""
+    style = option_style.lower()
+    if style in ['call', 'c']:
+        return True
+    if style in ['put', 'p']:
+        return False
+    raise ValueError("Option style must be 'call' or 'put'")
+
+def _black_scholes_price(style_is_call, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate):
+    """European option price for an already-resolved option style"""
+    # Calculate d1 and d2 parameters
+    sqrt_T = sqrt(time_to_expiry)
+    d1_numerator = log(spot_price / strike_price) + (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry
+    d1_denominator = volatility * sqrt_T
+    d1 = d1_numerator / d1_denominator
+    d2 = d1 - d1_denominator
+    discounted_strike = strike_price * exp(-risk_free_rate * time_to_expiry)
+    
+    # Price calculation based on option type
+    if style_is_call:
+        return spot_price * _py_norm_cdf(d1) - discounted_strike * _py_norm_cdf(d2)
+    return discounted_strike * _py_norm_cdf(-d2) - spot_price * _py_norm_cdf(-d1)
+
 def compute_black_scholes_price(option_style, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate):
     """
     Calculate European option price using the Black-Scholes model
@@ -27,84 +89,359 @@ def compute_black_scholes_price(option_style, spot_price, strike_price, volatili
     time_to_expiry: Time until expiration in years
     risk_free_rate: Continuously compounded risk-free interest rate
     """
-    # Calculate d1 and d2 parameters
-    d1_numerator = np.log(spot_price / strike_price) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry
-    d1_denominator = volatility * np.sqrt(time_to_expiry)
-    d1 = d1_numerator / d1_denominator
-    d2 = d1 - volatility * np.sqrt(time_to_expiry)
+    return _black_scholes_price(
+        _resolve_option_style(option_style), spot_price, strike_price,
+        volatility, time_to_expiry, risk_free_rate
+    )
+
+@njit(cache=True, fastmath=True)
+def _price_and_vega(style_is_call, spot_price, discounted_strike, log_moneyness, rate_time,
+                    volatility, sqrt_T, time_to_expiry):
+    """
+    Compute the Black-Scholes price, vega and vomma together in a single pass
+
+    Takes the volatility-independent terms (discounted strike, ln(S/K), rT
+    and √T) precomputed so the root-finding loop only evaluates d1, d2
+    and the normal distribution once per iteration
+    """
+    vol_sqrt_T = volatility * sqrt_T
+    d1 = (log_moneyness + rate_time + 0.5 * volatility * volatility * time_to_expiry) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
     
-    # Price calculation based on option type
-    if option_style.lower() in ['call', 'c']:
-        option_value = (spot_price * stats.norm.cdf(d1) - 
-                       strike_price * np.exp(-risk_free_rate * time_to_expiry) * stats.norm.cdf(d2))
-    elif option_style.lower() in ['put', 'p']:
-        option_value = (strike_price * np.exp(-risk_free_rate * time_to_expiry) * stats.norm.cdf(-d2) - 
-                       spot_price * stats.norm.cdf(-d1))
+    if style_is_call:
+        option_value = spot_price * _norm_cdf(d1) - discounted_strike * _norm_cdf(d2)
     else:
-        raise ValueError("Option style must be 'call' or 'put'")
+        option_value = discounted_strike * _norm_cdf(-d2) - spot_price * _norm_cdf(-d1)
     
-    return option_value
+    # K·e^(-rT)·φ(d2) == S·φ(d1), so vega can reuse the discounted strike
+    vega = discounted_strike * _norm_pdf(d2) * sqrt_T
+    # Vomma (∂²V/∂σ²) is the same for calls and puts
+    vomma = vega * d1 * d2 / volatility
+    return option_value, vega, vomma
 
-def find_implied_volatility(option_style, spot_price, strike_price, initial_vol_guess, 
-                           time_to_expiry, risk_free_rate, market_option_price):
+@njit(cache=True, fastmath=True)
+def _clamp_volatility(volatility):
     """
-    Determine implied volatility using the Newton-Raphson numerical method
-    
-    Iteratively solves for the volatility that makes the Black-Scholes price 
-    match the observed market price
+    Keep volatility within the solver's bounds without branching
+
+    Both bounds are constants, so this lowers to a single minsd/maxsd pair
+    """
+    return min(_MAX_VOLATILITY, max(_MIN_VOLATILITY, volatility))
+
+@njit(cache=True, fastmath=True)
+def _initial_sigma(log_moneyness, rate_time, time_to_expiry):
+    """
+    Inflection point of the Black-Scholes price in volatility
+
+    σ_c = √|2/τ · (ln(S/K) + rτ)|. The price is convex below σ_c and concave
+    above it, so iterating from σ_c converges for any attainable market price
+    """
+    return sqrt(abs(2.0 / time_to_expiry * (log_moneyness + rate_time)))
+
+@njit(cache=True, fastmath=True)
+def _corrado_miller(spot_price, discounted_strike, time_to_expiry, call_price):
+    """
+    Corrado-Miller closed-form estimate of implied volatility from a call price
+
+    σ ≈ √(2π/τ) / (S + X) · [C - (S - X)/2 + √((C - (S - X)/2)² - (S - X)²/π)]
+    with X = K·e^(-rτ). Accurate to about 1% near the money
+    """
+    half_moneyness = 0.5 * (spot_price - discounted_strike)
+    time_value = call_price - half_moneyness
+    discriminant = max(0.0, time_value * time_value - 4.0 * half_moneyness * half_moneyness / pi)
+    return sqrt(2.0 * pi / time_to_expiry) / (spot_price + discounted_strike) * (time_value + sqrt(discriminant))
+
+@njit(cache=True, fastmath=True)
+def _iterate_implied_volatility(style_is_call, spot_price, discounted_strike, log_moneyness, rate_time,
+                                sqrt_T, time_to_expiry, market_option_price, initial_vol_guess):
+    """
+    Run Halley iterations from an initial guess until the price error converges
+
+    Returns the last evaluated volatility, the number of iterations used,
+    the theoretical price at that volatility and whether the price error
+    converged
     """
     current_volatility = initial_vol_guess
     convergence_threshold = 1e-10
     iteration_count = 0
     maximum_iterations = 100
-    price_discrepancy = float('inf')
+    evaluated_volatility = current_volatility
+    theoretical_price = 0.0
+    # Floored rather than branched, since fastmath may evaluate both sides of a branch
+    log_market_price = log(max(market_option_price, _MIN_NORMAL))
+    inflection_volatility = _initial_sigma(log_moneyness, rate_time, time_to_expiry)
     
-    while abs(price_discrepancy) > convergence_threshold and iteration_count < maximum_iterations:
-        # Calculate current theoretical price and vega
-        theoretical_price = compute_black_scholes_price(
-            option_style, spot_price, strike_price, current_volatility, 
-            time_to_expiry, risk_free_rate
-        )
-        
-        vega_value = calculate_option_vega(
-            spot_price, strike_price, current_volatility, 
-            time_to_expiry, risk_free_rate
+    while iteration_count < maximum_iterations:
+        # Calculate current theoretical price and its first two volatility derivatives
+        theoretical_price, vega_value, vomma_value = _price_and_vega(
+            style_is_call, spot_price, discounted_strike, log_moneyness, rate_time,
+            current_volatility, sqrt_T, time_to_expiry
         )
+        evaluated_volatility = current_volatility
+        iteration_count += 1
         
         price_discrepancy = theoretical_price - market_option_price
+        if abs(price_discrepancy) <= convergence_threshold:
+            return evaluated_volatility, iteration_count, theoretical_price, True
+        
+        price_underflowed = theoretical_price < _MIN_NORMAL
+        if current_volatility < inflection_volatility and not price_underflowed and market_option_price > 0.0:
+            # Below the inflection point V(σ) is convex with a flat lower tail; solving
+            # ln V(σ) = ln V_market instead (Jäckel) keeps the steps well conditioned
+            error_value = log(theoretical_price) - log_market_price
+            first_derivative = vega_value / theoretical_price
+            second_derivative = vomma_value / theoretical_price - first_derivative * first_derivative
+        else:
+            # Above the inflection point V(σ) is concave and the price itself is
+            # well behaved; it is also the fallback where ln V is undefined
+            error_value = price_discrepancy
+            first_derivative = vega_value
+            second_derivative = vomma_value
         
-        # Avoid division by zero or numerical instability
-        if abs(vega_value) < 1e-12:
-            current_volatility += 0.01  # Small adjustment to escape flat region
-            iteration_count += 1
+        if price_underflowed or first_derivative <= 0.0:
+            # The price has underflowed to zero; raise volatility until it registers
+            current_volatility = min(_MAX_VOLATILITY, 2.0 * current_volatility)
             continue
         
-        # Newton-Raphson update: σ_new = σ_old - (price_error / vega)
-        volatility_adjustment = price_discrepancy / vega_value
+        # Halley update: σ_new = σ_old - (g/g') / (1 - ½·(g/g')·(g''/g'))
+        newton_step = error_value / first_derivative
+        halley_denominator = 1.0 - 0.5 * newton_step * second_derivative / first_derivative
+        if halley_denominator > 0.0:
+            volatility_adjustment = newton_step / halley_denominator
+        else:
+            # Far from the root the correction can flip sign; take a plain Newton step
+            volatility_adjustment = newton_step
         current_volatility -= volatility_adjustment
         
         # Ensure volatility stays within reasonable bounds
-        current_volatility = max(0.001, min(5.0, current_volatility))
-        
-        iteration_count += 1
+        current_volatility = _clamp_volatility(current_volatility)
     
-    return current_volatility, iteration_count
+    return evaluated_volatility, iteration_count, theoretical_price, False
 
-def main():
-    """Main application function for the Implied Volatility Calculator"""
+@njit(cache=True, fastmath=True)
+def _iv_solve(style_is_call, spot_price, strike_price, initial_vol_guess,
+              time_to_expiry, risk_free_rate, market_option_price):
+    """
+    Compiled implied volatility solve for an already-resolved option style
+
+    A non-positive initial_vol_guess starts from the Corrado-Miller estimate.
+    Returns the implied volatility, the total number of iterations used and
+    the theoretical price at the implied volatility
+    """
+    # Volatility-independent terms are constant across iterations
+    log_moneyness = log(spot_price / strike_price)
+    rate_time = risk_free_rate * time_to_expiry
+    discounted_strike = strike_price * exp(-rate_time)
+    sqrt_T = sqrt(time_to_expiry)
     
-    st.set_page_config(
-        page_title="Options Analytics: Implied Volatility Calculator",
-        page_icon="📊",
-        layout="wide"
+    # Solve on the out-of-the-money side, where the price is all time value and
+    # ln V responds to volatility. Put-call parity gives the same implied volatility
+    solve_call = log_moneyness + rate_time <= 0.0
+    parity_shift = 0.0
+    if solve_call != style_is_call:
+        # C - P = S - K·e^(-rT)
+        parity_shift = spot_price - discounted_strike if solve_call else discounted_strike - spot_price
+    otm_market_price = market_option_price + parity_shift
+    
+    if initial_vol_guess <= 0.0:
+        call_price = otm_market_price if solve_call else otm_market_price + spot_price - discounted_strike
+        initial_vol_guess = _clamp_volatility(
+            _corrado_miller(spot_price, discounted_strike, time_to_expiry, call_price)
+        )
+    
+    implied_vol, iteration_count, final_price, converged = _iterate_implied_volatility(
+        solve_call, spot_price, discounted_strike, log_moneyness, rate_time,
+        sqrt_T, time_to_expiry, otm_market_price, initial_vol_guess
     )
     
-    # Application header
-    st.title("📊 Options Analytics: Implied Volatility Calculator")
-    st.markdown("""
-    Calculate the implied volatility of European options using the Black-Scholes model 
-    and Newton-Raphson numerical method.
-    """)
+    if not converged:
+        fallback_vol = _clamp_volatility(_initial_sigma(log_moneyness, rate_time, time_to_expiry))
+        implied_vol, fallback_iterations, final_price, converged = _iterate_implied_volatility(
+            solve_call, spot_price, discounted_strike, log_moneyness, rate_time,
+            sqrt_T, time_to_expiry, otm_market_price, fallback_vol
+        )
+        iteration_count += fallback_iterations
+    
+    return implied_vol, iteration_count, final_price - parity_shift
+
+def _solver_source_hash():
+    """
+    Fingerprint of the compiled solver: the source of every kernel _iv_solve
+    reaches plus the module constants they read, folded into a signed 64-bit int
+    """
+    kernels = [_norm_cdf, _norm_pdf, _price_and_vega, _clamp_volatility, _initial_sigma,
+               _corrado_miller, _iterate_implied_volatility, _iv_solve]
+    constants = [_SQRT_2, _INV_SQRT_2PI, _MIN_NORMAL, _MIN_VOLATILITY, _MAX_VOLATILITY]
+    digest = hashlib.sha256()
+    for kernel in kernels:
+        digest.update(inspect.getsource(kernel.py_func).encode())
+    digest.update(repr(constants).encode())
+    return int(digest.hexdigest()[:15], 16)
+
+SOLVER_SOURCE_HASH = _solver_source_hash()
+
+# Ahead-of-time build of _iv_solve from build_kernels.py, used only if it was
+# built from this exact solver source
+try:
+    import iv_kernel
+except ImportError:
+    _precompiled_iv_solve = None
+else:
+    if getattr(iv_kernel, 'source_hash', lambda: None)() == SOLVER_SOURCE_HASH:
+        _precompiled_iv_solve = iv_kernel.iv_solve
+    else:
+        warnings.warn("iv_kernel was built from a different solver source; "
+                      "ignoring it and using the JIT solver. Rerun build_kernels.py to refresh it")
+        _precompiled_iv_solve = None
+
+def find_implied_volatility(option_style, spot_price, strike_price, initial_vol_guess, 
+                           time_to_expiry, risk_free_rate, market_option_price):
+    """
+    Determine implied volatility using Halley's method
+    
+    Iteratively solves for the volatility that makes the Black-Scholes price 
+    match the observed market price. If the initial guess does not converge,
+    the solve is restarted from the inflection point of the price curve.
+    Passing None as initial_vol_guess starts from the Corrado-Miller estimate.
+    Returns the implied volatility, the iterations used and the theoretical
+    price at the implied volatility
+    """
+    # Resolve the option style once rather than on every iteration
+    style_is_call = _resolve_option_style(option_style)
+    
+    if initial_vol_guess is None:
+        initial_vol_guess = 0.0
+    
+    solve = _iv_solve if _precompiled_iv_solve is None else _precompiled_iv_solve
+    return solve(
+        style_is_call, float(spot_price), float(strike_price), float(initial_vol_guess),
+        float(time_to_expiry), float(risk_free_rate), float(market_option_price)
+    )
+
+if _precompiled_iv_solve is None:
+    # Compile the solver at import so the first calculation does not pay the JIT cost
+    _iv_solve(True, 100.0, 100.0, 0.25, 1.0, 0.05, 10.0)
+
+def _iv_batch_kernel(style_is_call, spot_price, strike_price, initial_vol_guess,
+                     time_to_expiry, risk_free_rate, market_option_price, implied_vol, model_price):
+    """Per-element body of the batch gufunc"""
+    solved_vol, _, final_price = _iv_solve(
+        style_is_call[0], spot_price[0], strike_price[0], initial_vol_guess[0],
+        time_to_expiry[0], risk_free_rate[0], market_option_price[0]
+    )
+    implied_vol[0] = solved_vol
+    model_price[0] = final_price
+
+@lru_cache(maxsize=None)
+def _iv_batch_gufunc():
+    """Compile the batch gufunc on first use rather than at import"""
+    return guvectorize(
+        ['void(boolean[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])'],
+        '(),(),(),(),(),(),()->(),()',
+        nopython=True, target='parallel', cache=True
+    )(_iv_batch_kernel)
+
+def iv_batch(style_is_call, spot_price, strike_price, initial_vol_guess,
+             time_to_expiry, risk_free_rate, market_option_price):
+    """
+    Solve implied volatility element-wise across whole arrays of options
+
+    Each element is an independent _iv_solve, so the parallel target spreads
+    the chain across all available cores. Returns the implied volatilities and
+    the model prices at them; rows whose quote has no solution keep a model
+    price away from the market price
+    """
+    return _iv_batch_gufunc()(
+        style_is_call, spot_price, strike_price, initial_vol_guess,
+        time_to_expiry, risk_free_rate, market_option_price
+    )
+
+def parse_option_chain(chain):
+    """
+    Validate an uploaded option chain and convert it to iv_batch inputs
+
+    Raises ValueError naming the column and 1-based rows of any bad value.
+    Blank or non-positive initial_vol cells start that row from the
+    Corrado-Miller estimate. Returns the style flags and the spot, strike,
+    initial guess, expiry, rate and market price arrays
+    """
+    required_columns = ['option_type', 'spot_price', 'strike_price', 'time_to_expiry', 
+                        'risk_free_rate', 'market_price']
+    missing_columns = [column for column in required_columns if column not in chain.columns]
+    if missing_columns:
+        raise ValueError(f"Missing columns: {', '.join(missing_columns)}")
+    
+    option_styles = chain['option_type'].astype(str).str.lower()
+    if not option_styles.isin(['call', 'c', 'put', 'p']).all():
+        raise ValueError("Option style must be 'call' or 'put'")
+    
+    # Same bounds the single-option inputs enforce, checked up front so one bad
+    # row is reported by number instead of failing inside the solver
+    columns = {}
+    for column, lower_bound, allow_equal in [('spot_price', 0.0, False), ('strike_price', 0.0, False),
+                                             ('time_to_expiry', 0.0, False), ('risk_free_rate', None, True),
+                                             ('market_price', 0.0, True), ('initial_vol', None, True)]:
+        if column not in chain.columns:
+            columns[column] = np.zeros(len(chain))
+            continue
+        values = pd.to_numeric(chain[column], errors='coerce')
+        invalid = ~np.isfinite(values.to_numpy(dtype=np.float64))
+        if column == 'initial_vol':
+            # Blank guesses are allowed and mean Corrado-Miller
+            invalid &= chain[column].notna().to_numpy()
+            values = values.fillna(0.0)
+        if lower_bound is not None:
+            invalid |= (values < lower_bound) if allow_equal else (values <= lower_bound)
+        if invalid.any():
+            bad_rows = ', '.join(str(row + 1) for row in np.flatnonzero(invalid)[:10])
+            requirement = "a finite number" if lower_bound is None else (
+                f"a finite number {'>=' if allow_equal else '>'} {lower_bound:g}")
+            if column == 'initial_vol':
+                requirement += " or blank"
+            raise ValueError(f"Column '{column}' must be {requirement} (rows {bad_rows})")
+        columns[column] = values.to_numpy(dtype=np.float64)
+    
+    return (
+        option_styles.isin(['call', 'c']).to_numpy(),
+        columns['spot_price'], columns['strike_price'], columns['initial_vol'],
+        columns['time_to_expiry'], columns['risk_free_rate'], columns['market_price']
+    )
+
+def solve_option_chain(chain):
+    """
+    Solve every row of an uploaded option chain
+
+    Returns a copy of the chain with implied_volatility and price_error columns
+    added, and the number of rows the model could not reprice to within tolerance
+    """
+    style_is_call, spot_price, strike_price, initial_vol_guess, time_to_expiry, \
+        risk_free_rate, market_option_price = parse_option_chain(chain)
+    implied_vols, model_prices = iv_batch(
+        style_is_call, spot_price, strike_price, initial_vol_guess,
+        time_to_expiry, risk_free_rate, market_option_price
+    )
+    chain = chain.copy()
+    chain['implied_volatility'] = implied_vols
+    chain['price_error'] = np.abs(model_prices - market_option_price)
+    # Written as "not within tolerance" so NaN errors count as unmatched
+    unmatched = int((~(chain['price_error'] < 1e-8)).sum())
+    return chain, unmatched
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def run_solve(option_style, spot_price, strike_price, initial_vol_guess,
+              time_to_expiry, risk_free_rate, market_option_price):
+    """
+    Solve for implied volatility, cached on the inputs
+
+    Returns the implied volatility, the iterations used and the validated price
+    """
+    return find_implied_volatility(
+        option_style, spot_price, strike_price, initial_vol_guess,
+        time_to_expiry, risk_free_rate, market_option_price
+    )
+
+def render_single_option_calculator():
+    """Inputs and results for solving the implied volatility of a single option"""
     
     # Create two columns for better layout
     col1, col2 = st.columns([1, 1])
@@ -159,14 +496,24 @@ def main():
             help="Observed market price of the option"
         )
         
+        use_closed_form_guess = st.checkbox(
+            "Use Corrado-Miller Initial Estimate",
+            value=True,
+            help="Closed-form estimate accurate to about 1% near the money, "
+                 "typically leaving only 1-2 refinement steps for the solver"
+        )
+        
         initial_vol_guess = st.number_input(
             "Initial Volatility Estimate", 
             value=0.25, 
             step=0.01,
             min_value=0.01,
             max_value=5.0,
+            disabled=use_closed_form_guess,
             help="Initial guess for the implied volatility calculation"
         )
+        if use_closed_form_guess:
+            initial_vol_guess = None
         
         st.markdown("---")
         calculate_button = st.button(
@@ -179,7 +526,7 @@ def main():
     if calculate_button:
         try:
             with st.spinner("Computing implied volatility..."):
-                implied_vol, iterations_used = find_implied_volatility(
+                implied_vol, iterations_used, validated_price = run_solve(
                     option_style, spot_price, strike_price, initial_vol_guess,
                     time_to_expiry, risk_free_rate, market_option_price
                 )
@@ -194,6 +541,7 @@ def main():
                 st.metric(
                     "Implied Volatility", 
                     f"{implied_vol:.4f}", 
+                    None if initial_vol_guess is None else
                     f"{(implied_vol - initial_vol_guess):+.4f} from initial guess"
                 )
             
@@ -201,15 +549,12 @@ def main():
                 st.metric("Iterations Required", f"{iterations_used}")
             
             with res_col3:
-                validated_price = compute_black_scholes_price(
-                    option_style, spot_price, strike_price, implied_vol,
-                    time_to_expiry, risk_free_rate
-                )
                 price_error = abs(validated_price - market_option_price)
                 st.metric("Price Validation Error", f"${price_error:.2e}")
             
             # Detailed results
             st.subheader("Detailed Results")
+            initial_guess_label = "Corrado-Miller" if initial_vol_guess is None else f"{initial_vol_guess:.4f}"
             results_markdown = f"""
             | Parameter | Value |
             |-----------|-------|
@@ -219,7 +564,7 @@ def main():
             | **Time to Expiry ($\\tau$)** | {time_to_expiry:.2f} years |
             | **Risk-free Rate ($r$)** | {risk_free_rate:.2%} |
             | **Market Option Price** | ${market_option_price:.2f} |
-            | **Initial Volatility Guess** | {initial_vol_guess:.4f} |
+            | **Initial Volatility Guess** | {initial_guess_label} |
             | **Calculated Implied Volatility** | **{implied_vol:.6f}** |
             | **Iterations to Converge** | {iterations_used} |
             """
@@ -227,15 +572,10 @@ def main():
             
             # Verification section
             st.subheader("🔍 Model Verification")
-            verification_price = compute_black_scholes_price(
-                option_style, spot_price, strike_price, implied_vol,
-                time_to_expiry, risk_free_rate
-            )
-            
-            st.write(f"**Theoretical Price using Implied Volatility:** ${verification_price:.6f}")
+            st.write(f"**Theoretical Price using Implied Volatility:** ${validated_price:.6f}")
             st.write(f"**Market Price:** ${market_option_price:.6f}")
             
-            if abs(verification_price - market_option_price) < 1e-8:
+            if abs(validated_price - market_option_price) < 1e-8:
                 st.success("✅ Excellent match between model and market prices!")
             else:
                 st.warning("⚠ Small discrepancy between model and market prices")
@@ -243,6 +583,66 @@ def main():
         except Exception as error:
             st.error(f"❌ Calculation Error: {str(error)}")
             st.info("💡 Tips: Check that all inputs are positive and try adjusting your initial volatility estimate")
+
+def render_batch_calculator():
+    """Upload an option chain as CSV and solve every row in one call"""
+    
+    st.markdown("""
+    Upload a CSV with one option per row and the columns `option_type` (call/put), 
+    `spot_price`, `strike_price`, `time_to_expiry`, `risk_free_rate` and `market_price`. 
+    An optional `initial_vol` column overrides the Corrado-Miller initial estimate;
+    blank or non-positive cells fall back to it for that row.
+    """)
+    
+    uploaded_file = st.file_uploader("Option Chain CSV", type="csv")
+    if uploaded_file is None:
+        return
+    
+    try:
+        chain = pd.read_csv(uploaded_file)
+        
+        with st.spinner(f"Computing implied volatility for {len(chain)} options..."):
+            chain, unmatched = solve_option_chain(chain)
+        
+        st.success(f"🎯 Solved {len(chain)} options!")
+        if unmatched:
+            st.warning(f"⚠ {unmatched} option(s) could not be matched by the model; "
+                       "check `price_error` for quotes outside the no-arbitrage bounds")
+        st.dataframe(chain, use_container_width=True)
+        st.download_button(
+            "📥 Download Results",
+            chain.to_csv(index=False),
+            file_name="implied_volatility.csv",
+            mime="text/csv"
+        )
+    
+    except Exception as error:
+        st.error(f"❌ Calculation Error: {str(error)}")
+        st.info("💡 Tips: Check the column names and that all numeric inputs are positive")
+
+def main():
+    """Main application function for the Implied Volatility Calculator"""
+    
+    st.set_page_config(
+        page_title="Options Analytics: Implied Volatility Calculator",
+        page_icon="📊",
+        layout="wide"
+    )
+    
+    # Application header
+    st.title("📊 Options Analytics: Implied Volatility Calculator")
+    st.markdown("""
+    Calculate the implied volatility of European options using the Black-Scholes model 
+    and Halley's numerical method.
+    """)
+    
+    single_tab, batch_tab = st.tabs(["Single Option", "Upload CSV"])
+    
+    with single_tab:
+        render_single_option_calculator()
+    
+    with batch_tab:
+        render_batch_calculator()
     
     # Information sidebar
     with st.sidebar:
@@ -253,7 +653,7 @@ def main():
         
         **Methodology:**
         - Black-Scholes option pricing model
-        - Newton-Raphson numerical root finding
+        - Halley's method (Newton-Raphson with vomma) for root finding
         - European-style options only
         
         **Assumptions:**
@@ -272,7 +672,7 @@ def main():
         - **Strike Price**: Option exercise price  
         - **Time to Expiry**: In years (e.g., 0.25 = 3 months)
         - **Risk-free Rate**: Annual rate (e.g., 0.05 = 5%)
-        - **Initial Volatility Guess**: Start with 0.2-0.3 for most stocks
+        - **Initial Volatility Guess**: Leave on Corrado-Miller, or start with 0.2-0.3 for most stocks
         """)
 
 if __name__ == "__main__":
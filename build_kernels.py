@@ -0,0 +1,32 @@
+"""
+Ahead-of-time build of the implied volatility kernel
+
+Compiles the solver into a native iv_kernel extension module next to app.py,
+so the app can skip JIT compilation of the single-option solve on startup.
+Run once per platform before deploying:
+
+    python build_kernels.py
+"""
+import os
+
+from numba.pycc import CC
+
+from app import _iv_solve, SOLVER_SOURCE_HASH
+
+cc = CC('iv_kernel')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export('iv_solve', 'Tuple((f8, i8, f8))(b1, f8, f8, f8, f8, f8, f8)')
+def iv_solve(style_is_call, spot_price, strike_price, initial_vol_guess,
+             time_to_expiry, risk_free_rate, market_option_price):
+    """Precompiled _iv_solve: implied volatility, iterations used and final price"""
+    return _iv_solve(style_is_call, spot_price, strike_price, initial_vol_guess,
+                     time_to_expiry, risk_free_rate, market_option_price)
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    """Hash of the solver source this extension was built from, checked by app.py"""
+    return SOLVER_SOURCE_HASH
+
+if __name__ == "__main__":
+    cc.compile()
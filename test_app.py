@@ -0,0 +1,158 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+from app import compute_black_scholes_price, find_implied_volatility, iv_batch, parse_option_chain, solve_option_chain
+
+
+def scipy_black_scholes_price(option_style, spot_price, strike_price, volatility,
+                              time_to_expiry, risk_free_rate):
+    """Reference Black-Scholes price using scipy.stats.norm"""
+    d1 = (np.log(spot_price / strike_price) + (risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry) \
+         / (volatility * np.sqrt(time_to_expiry))
+    d2 = d1 - volatility * np.sqrt(time_to_expiry)
+    discounted_strike = strike_price * np.exp(-risk_free_rate * time_to_expiry)
+    if option_style == 'call':
+        return spot_price * norm.cdf(d1) - discounted_strike * norm.cdf(d2)
+    return discounted_strike * norm.cdf(-d2) - spot_price * norm.cdf(-d1)
+
+
+def random_options(count, seed=0):
+    """Random (style, spot, strike, volatility, expiry, rate) tuples with a well-defined implied vol"""
+    rng = np.random.default_rng(seed)
+    options = []
+    while len(options) < count:
+        option_style = 'call' if rng.random() < 0.5 else 'put'
+        spot_price = 100.0
+        strike_price = spot_price * np.exp(rng.uniform(-0.5, 0.5))
+        volatility = rng.uniform(0.05, 1.5)
+        time_to_expiry = rng.uniform(0.05, 3.0)
+        risk_free_rate = rng.uniform(0.0, 0.08)
+        price = scipy_black_scholes_price(option_style, spot_price, strike_price, volatility,
+                                          time_to_expiry, risk_free_rate)
+        # Skip quotes with almost no time value, where the vol is not identifiable
+        intrinsic = max(0.0, (spot_price - strike_price * np.exp(-risk_free_rate * time_to_expiry))
+                        * (1 if option_style == 'call' else -1))
+        if price - intrinsic < 1e-6:
+            continue
+        options.append((option_style, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate))
+    return options
+
+
+@pytest.mark.parametrize("option_style", ['call', 'put'])
+def test_price_matches_scipy(option_style):
+    for _, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate in random_options(200):
+        expected = scipy_black_scholes_price(option_style, spot_price, strike_price, volatility,
+                                             time_to_expiry, risk_free_rate)
+        price = compute_black_scholes_price(option_style, spot_price, strike_price, volatility,
+                                            time_to_expiry, risk_free_rate)
+        assert price == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("initial_vol_guess", [None, 0.25, 3.0])
+def test_round_trip(initial_vol_guess):
+    for option_style, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate in random_options(300):
+        price = scipy_black_scholes_price(option_style, spot_price, strike_price, volatility,
+                                          time_to_expiry, risk_free_rate)
+        implied_vol, _, final_price = find_implied_volatility(
+            option_style, spot_price, strike_price, initial_vol_guess,
+            time_to_expiry, risk_free_rate, price
+        )
+        assert final_price == pytest.approx(price, abs=1e-9)
+        assert implied_vol == pytest.approx(volatility, rel=1e-6)
+
+
+@pytest.mark.parametrize("option_style,strike_price", [('call', 70.0), ('put', 140.0)])
+def test_in_the_money_round_trip(option_style, strike_price):
+    # In-the-money quotes are solved on the out-of-the-money side via put-call parity
+    price = scipy_black_scholes_price(option_style, 100.0, strike_price, 0.3, 1.0, 0.05)
+    implied_vol, _, final_price = find_implied_volatility(option_style, 100.0, strike_price, None,
+                                                          1.0, 0.05, price)
+    assert final_price == pytest.approx(price, abs=1e-9)
+    assert implied_vol == pytest.approx(0.3, rel=1e-8)
+
+
+@pytest.mark.parametrize("option_style,strike_price", [('call', 170.0), ('put', 60.0)])
+def test_deep_out_of_the_money_round_trip(option_style, strike_price):
+    # Tiny prices far below the inflection point go through the log-price solve
+    price = scipy_black_scholes_price(option_style, 100.0, strike_price, 0.2, 0.25, 0.01)
+    assert price < 1e-6
+    implied_vol, _, final_price = find_implied_volatility(option_style, 100.0, strike_price, 0.5,
+                                                          0.25, 0.01, price)
+    # Convergence is on absolute price error, so a tiny quote pins the vol less tightly
+    assert final_price == pytest.approx(price, abs=1e-10)
+    assert implied_vol == pytest.approx(0.2, rel=1e-4)
+
+
+def test_invalid_option_style():
+    with pytest.raises(ValueError):
+        find_implied_volatility('straddle', 100.0, 100.0, 0.25, 1.0, 0.05, 10.0)
+
+
+def test_batch_matches_single_solve():
+    options = random_options(500, seed=1)
+    option_style, spot_price, strike_price, volatility, time_to_expiry, risk_free_rate = map(np.array, zip(*options))
+    market_price = np.array([scipy_black_scholes_price(*option) for option in options])
+    initial_vol_guess = np.zeros(len(options))
+
+    implied_vols, model_prices = iv_batch(option_style == 'call', spot_price, strike_price, initial_vol_guess,
+                                          time_to_expiry, risk_free_rate, market_price)
+
+    np.testing.assert_allclose(model_prices, market_price, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(implied_vols, volatility, rtol=1e-6)
+    for i in range(0, len(options), 50):
+        implied_vol, _, _ = find_implied_volatility(option_style[i], spot_price[i], strike_price[i], None,
+                                                    time_to_expiry[i], risk_free_rate[i], market_price[i])
+        assert implied_vols[i] == pytest.approx(implied_vol, rel=1e-12)
+
+
+def read_chain(csv_text):
+    """Option chain DataFrame as read from an uploaded CSV"""
+    return pd.read_csv(io.StringIO(csv_text))
+
+
+@pytest.mark.parametrize("bad_value,column", [('-5', 'strike_price'), ('abc', 'spot_price'),
+                                              ('inf', 'initial_vol'), ('abc', 'initial_vol')])
+def test_parse_option_chain_reports_bad_row(bad_value, column):
+    values = {'spot_price': '100', 'strike_price': '100', 'initial_vol': '0.2'}
+    values[column] = bad_value
+    chain = read_chain(
+        "option_type,spot_price,strike_price,time_to_expiry,risk_free_rate,market_price,initial_vol\n"
+        "call,100,100,1,0.05,10,0.2\n"
+        f"put,{values['spot_price']},{values['strike_price']},1,0.05,5,{values['initial_vol']}\n"
+    )
+    with pytest.raises(ValueError, match=rf"Column '{column}' .*\(rows 2\)"):
+        parse_option_chain(chain)
+
+
+def test_blank_initial_vol_uses_corrado_miller():
+    price = scipy_black_scholes_price('call', 100.0, 110.0, 0.3, 0.5, 0.02)
+    chain = read_chain(
+        "option_type,spot_price,strike_price,time_to_expiry,risk_free_rate,market_price,initial_vol\n"
+        f"call,100,110,0.5,0.02,{float(price)!r},\n"
+        f"call,100,110,0.5,0.02,{float(price)!r},0.25\n"
+    )
+    assert parse_option_chain(chain)[3].tolist() == [0.0, 0.25]
+
+    solved, unmatched = solve_option_chain(chain)
+    expected_vol, _, _ = find_implied_volatility('call', 100.0, 110.0, None, 0.5, 0.02, price)
+    assert unmatched == 0
+    assert solved['implied_volatility'][0] == pytest.approx(expected_vol, rel=1e-12)
+    assert solved['implied_volatility'][0] == pytest.approx(0.3, rel=1e-6)
+
+
+def test_unsolvable_quote_counted_as_unmatched():
+    price = scipy_black_scholes_price('put', 100.0, 95.0, 0.25, 1.0, 0.03)
+    # The second call is quoted below its intrinsic value, so no volatility reprices it
+    chain = read_chain(
+        "option_type,spot_price,strike_price,time_to_expiry,risk_free_rate,market_price\n"
+        f"put,100,95,1,0.03,{float(price)!r}\n"
+        "call,100,80,1,0.03,5\n"
+    )
+    solved, unmatched = solve_option_chain(chain)
+    assert unmatched == 1
+    assert solved['price_error'][0] < 1e-8
+    assert not solved['price_error'][1] < 1e-8